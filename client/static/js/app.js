@@ -519,6 +519,10 @@ async function showSizeEstimation(vmId) {
 }
 
 // Batch vXRAIL Estimation
+
+// Estimate requests in flight at once during batch estimation
+const BATCH_ESTIMATION_CONCURRENCY = 4;
+
 async function showBatchEstimationModal() {
     const envs = await api.getEnvironments();
 
@@ -606,35 +610,51 @@ async function runBatchEstimation() {
         hasSnapshots: false,
     };
 
-    const results = [];
+    // Run a few estimates at a time instead of one request after another;
+    // results keep the order the VMs were selected in
+    const selected = Array.from(checkboxes);
+    const results = new Array(selected.length);
+    let next = 0;
+
+    const estimateNext = async () => {
+        while (next < selected.length) {
+            const i = next++;
+            const cb = selected[i];
+            try {
+                const estimation = await api.estimateVMSize(cb.value, targetType, vxrailConfig);
+                results[i] = {
+                    name: cb.dataset.name,
+                    source: estimation.source_size_gb,
+                    logical: estimation.logical_size_gb || estimation.source_size_gb,
+                    estimated: estimation.estimated_size_gb,
+                    change: estimation.change_percent || 0,
+                    notes: estimation.notes || '',
+                };
+            } catch (error) {
+                results[i] = {
+                    name: cb.dataset.name,
+                    source: parseFloat(cb.dataset.size),
+                    logical: parseFloat(cb.dataset.size) / 2,
+                    estimated: parseFloat(cb.dataset.size) * 0.5,
+                    change: -50,
+                    error: true,
+                };
+            }
+        }
+    };
+
+    const workers = Math.min(BATCH_ESTIMATION_CONCURRENCY, selected.length);
+    await Promise.all(Array.from({ length: workers }, estimateNext));
+
+    // Totals cover successful estimates only
     let totalSource = 0;
     let totalLogical = 0;
     let totalEstimated = 0;
-
-    for (const cb of checkboxes) {
-        try {
-            const estimation = await api.estimateVMSize(cb.value, targetType, vxrailConfig);
-            results.push({
-                name: cb.dataset.name,
-                source: estimation.source_size_gb,
-                logical: estimation.logical_size_gb || estimation.source_size_gb,
-                estimated: estimation.estimated_size_gb,
-                change: estimation.change_percent || 0,
-                notes: estimation.notes || '',
-            });
-            totalSource += estimation.source_size_gb;
-            totalLogical += estimation.logical_size_gb || estimation.source_size_gb;
-            totalEstimated += estimation.estimated_size_gb;
-        } catch (error) {
-            results.push({
-                name: cb.dataset.name,
-                source: parseFloat(cb.dataset.size),
-                logical: parseFloat(cb.dataset.size) / 2,
-                estimated: parseFloat(cb.dataset.size) * 0.5,
-                change: -50,
-                error: true,
-            });
-        }
+    for (const r of results) {
+        if (r.error) continue;
+        totalSource += r.source;
+        totalLogical += r.logical;
+        totalEstimated += r.estimated;
     }
 
     tbody.innerHTML = results.map(r => {
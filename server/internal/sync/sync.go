@@ -2,6 +2,8 @@ package sync
 
 import (
 	"fmt"
+	"sort"
+	"strings"
 	"time"
 )
 
@@ -195,6 +197,16 @@ var RAIDOverhead = map[string]float64{
 	"none":       1.0,  // No RAID/FTT=0
 }
 
+// raidNotes holds the "Primary data" note for each RAID policy, formatted once
+// rather than on every estimate
+var raidNotes = func() map[string]string {
+	notes := make(map[string]string, len(RAIDOverhead))
+	for policy, overhead := range RAIDOverhead {
+		notes[policy] = fmt.Sprintf("Primary data (÷%.2f RAID)", overhead)
+	}
+	return notes
+}()
+
 // Organic adjustment factors based on VMware documentation
 // These account for factors that cause reported size to differ from actual data
 var OrganicFactors = struct {
@@ -213,6 +225,10 @@ var OrganicFactors = struct {
 	SnapshotOverhead:     0.90,
 }
 
+// azureDiskTiers are the Azure Managed Disk sizes in GiB, in ascending order.
+// Estimates are rounded up to the smallest tier that fits.
+var azureDiskTiers = []float64{4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32767}
+
 // VXRailConfig holds VXRail-specific estimation parameters
 type VXRailConfig struct {
 	RAIDPolicy       string  `json:"raid_policy"`        // raid1_ftt1, raid5_ftt1, etc.
@@ -249,17 +265,19 @@ func EstimateSizeWithConfig(diskSizeGB, memoryGB float64, cpuCount int, targetTy
 		SourceSizeGB: diskSizeGB,
 	}
 
-	var notes []string
+	notes := make([]string, 0, 5)
 	logicalSize := diskSizeGB
 
 	// Step 1: Remove RAID overhead to get logical/primary data
 	if isVXRail {
-		raidOverhead := RAIDOverhead[config.RAIDPolicy]
+		raidPolicy := config.RAIDPolicy
+		raidOverhead := RAIDOverhead[raidPolicy]
 		if raidOverhead == 0 {
-			raidOverhead = RAIDOverhead["raid1_ftt1"] // Default to RAID-1 FTT=1
+			raidPolicy = "raid1_ftt1" // Default to RAID-1 FTT=1
+			raidOverhead = RAIDOverhead[raidPolicy]
 		}
 		logicalSize = diskSizeGB / raidOverhead
-		notes = append(notes, fmt.Sprintf("Primary data (÷%.2f RAID)", raidOverhead))
+		notes = append(notes, raidNotes[raidPolicy])
 	}
 
 	estimation.LogicalSizeGB = logicalSize
@@ -302,12 +320,15 @@ func EstimateSizeWithConfig(diskSizeGB, memoryGB float64, cpuCount int, targetTy
 		notes = append(notes, "VMware thin provisioning")
 
 	case "aws":
-		// AWS EBS rounds up to nearest GiB
+		// AWS EBS volumes are sized in whole GiB. int()+1 rather than
+		// math.Ceil is deliberate: it also adds a GiB of headroom when the
+		// estimate is already a whole number (e.g. 100 -> 101).
 		estimatedSize = float64(int(estimatedSize) + 1)
 		notes = append(notes, "AWS EBS GP3 (rounded up)")
 
 	case "gcp":
-		// GCP minimum 10 GB, rounded up
+		// GCP minimum 10 GB, rounded up to whole GiB with the same
+		// one-GiB headroom as AWS (so the minimum disk is 11 GiB)
 		if estimatedSize < 10 {
 			estimatedSize = 10
 		}
@@ -315,13 +336,9 @@ func EstimateSizeWithConfig(diskSizeGB, memoryGB float64, cpuCount int, targetTy
 		notes = append(notes, "GCP Persistent Disk (min 10 GiB)")
 
 	case "azure":
-		// Azure aligns to standard disk tiers
-		standardSizes := []float64{4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32767}
-		for _, size := range standardSizes {
-			if size >= estimatedSize {
-				estimatedSize = size
-				break
-			}
+		// Azure aligns to standard disk tiers (sizes above the largest tier are left as is)
+		if i := sort.SearchFloat64s(azureDiskTiers, estimatedSize); i < len(azureDiskTiers) {
+			estimatedSize = azureDiskTiers[i]
 		}
 		notes = append(notes, "Azure Managed Disk tier")
 	}
@@ -334,14 +351,7 @@ func EstimateSizeWithConfig(diskSizeGB, memoryGB float64, cpuCount int, targetTy
 	}
 
 	// Build notes string
-	notesStr := ""
-	for i, note := range notes {
-		if i > 0 {
-			notesStr += "; "
-		}
-		notesStr += note
-	}
-	estimation.Notes = notesStr
+	estimation.Notes = strings.Join(notes, "; ")
 
 	return estimation
 }
@@ -26,21 +26,24 @@ Requirements:
 Optional (for more accurate vSAN metrics):
     VMware vSAN SDK (vsanmgmtObjects.py, vsanapiutils.py)
 
+Optional (faster --incremental cache encoding):
+    pip install orjson
+
 References:
     - https://blogs.vmware.com/cloud-foundation/2022/01/14/demystifying-capacity-reporting-in-vsan/
     - https://blogs.vmware.com/cloud-foundation/2022/03/10/the-importance-of-space-reclamation-for-data-usage-reporting-in-vsan/
     - https://developer.broadcom.com/xapis/vsan-management-api/latest/
 """
 
-import argparse
 import atexit
-import csv
-import getpass
+import json
 import os
+import re
 import ssl
 import sys
+import time
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import List, Optional, Dict, Any, Tuple
 
 try:
@@ -59,6 +62,14 @@ try:
 except ImportError:
     pass
 
+# Try to import orjson (optional, faster encoding of the --incremental cache)
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
 
 # RAID overhead multipliers (physical space per unit of logical data)
 RAID_OVERHEAD = {
@@ -70,6 +81,15 @@ RAID_OVERHEAD = {
     'None': 1.0,
 }
 
+# Default RAID policy keyed by (hostFailuresToTolerate, erasure coding enabled)
+RAID_POLICY_BY_FTT = {
+    (1, False): 'RAID-1 (FTT=1)',
+    (2, False): 'RAID-1 (FTT=2)',
+    (3, False): 'RAID-1 (FTT=3)',
+    (1, True): 'RAID-5 (FTT=1)',
+    (2, True): 'RAID-6 (FTT=2)',
+}
+
 # Organic adjustment factors based on VMware documentation and empirical data
 # These account for factors that cause reported size to differ from actual data
 ORGANIC_FACTORS = {
@@ -93,8 +113,72 @@ ORGANIC_FACTORS = {
     'snapshot_overhead': 0.90,       # Snapshots consolidate on migration
 }
 
+# Snapshot consolidation is the only per-VM factor; bound once here so
+# calculate_estimate() does not repeat the dict lookup for every VM
+SNAPSHOT_OVERHEAD = ORGANIC_FACTORS['snapshot_overhead']
+
+
+# Matches VXRail in cluster or host names
+VXRAIL_NAME_PATTERN = re.compile('vxrail', re.IGNORECASE)
+
+# Properties fetched in bulk by get_inventory()
+CLUSTER_PROPERTIES = ['name', 'configurationEx', 'host']
+HOST_PROPERTIES = ['name']
+RESOURCE_POOL_PROPERTIES = ['owner']
+VM_PROPERTIES = [
+    'name',
+    'config.template',
+    'runtime.powerState',
+    'resourcePool',
+    'config.instanceUuid',
+    'config.changeVersion',
+    'summary.storage.committed',
+]
+
+# Fetched by load_vm_storage_properties() only for VMs that pass the
+# template/power-state filters (committed size is already in VM_PROPERTIES)
+VM_STORAGE_PROPERTIES = [
+    'rootSnapshot',
+    'summary.storage.uncommitted',
+]
+
+# On-disk caches: per-VM storage details (--incremental) and per-cluster
+# vSAN space usage
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'vxrail_estimator')
+
+# Seconds a cached vSAN cluster space usage result or --use-cache inventory
+# snapshot stays valid (--cache-ttl)
+CACHE_TTL = 3600
+
+# VM properties kept in the --use-cache inventory snapshot (rootSnapshot is
+# stored separately as a flag)
+INVENTORY_SNAPSHOT_VM_KEYS = [
+    'name',
+    'cluster',
+    'config.template',
+    'config.instanceUuid',
+    'summary.storage.committed',
+    'summary.storage.uncommitted',
+]
+
+# Maximum objects per RetrievePropertiesEx / ContinueRetrievePropertiesEx page
+PROPERTY_COLLECTOR_PAGE_SIZE = 500
+
+# Maximum entities per VsanQueryEntitySpaceUsage call
+VSAN_ENTITY_QUERY_BATCH = 100
 
-@dataclass
+# Default concurrent vSAN API requests (independent per-cluster / per-batch RPCs, --workers)
+VSAN_QUERY_WORKERS = 8
+
+# Output file buffer size, so streamed CSV rows reach disk in large writes
+CSV_WRITE_BUFFER = 1 << 20
+
+
+# __slots__ on the dataclasses below where supported (Python 3.10+)
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class VSANConfig:
     """Detected vSAN cluster configuration."""
     cluster_name: str
@@ -113,9 +197,17 @@ class VSANConfig:
     overhead_capacity_gb: float = 0.0
     total_capacity_gb: float = 0.0
     used_capacity_gb: float = 0.0
+    # Per-VM multipliers folded from the settings above (see compute_estimate_factors)
+    logical_factor: float = 1.0      # used_gb -> logical_gb
+    expansion_factor: float = 1.0    # logical_gb -> estimated_gb (before snapshot adj)
+    estimate_factor: float = 1.0     # used_gb -> estimated_gb (before snapshot adj)
+    estimate_notes: str = ""
+    snapshot_notes: str = ""         # estimate_notes for VMs with snapshots
+    measured_notes: str = ""         # estimate_notes when vSAN measured the primary data
+    measured_snapshot_notes: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class VMInfo:
     """VM storage information."""
     name: str
@@ -129,11 +221,19 @@ class VMInfo:
     notes: str = ""
 
 
-def connect_to_vcenter(host: str, username: str, password: str, port: int = 443) -> vim.ServiceInstance:
-    """Connect to vCenter and return service instance."""
+def create_ssl_context() -> ssl.SSLContext:
+    """Create the SSL context shared by the vCenter and vSAN connections."""
     context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
     context.check_hostname = False
     context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def connect_to_vcenter(host: str, username: str, password: str, port: int = 443,
+                       context: Optional[ssl.SSLContext] = None) -> vim.ServiceInstance:
+    """Connect to vCenter and return service instance."""
+    if context is None:
+        context = create_ssl_context()
 
     try:
         si = SmartConnect(
@@ -153,178 +253,398 @@ def connect_to_vcenter(host: str, username: str, password: str, port: int = 443)
         sys.exit(1)
 
 
-def get_vsan_stub(si: vim.ServiceInstance, host: str, context: ssl.SSLContext):
+def get_vsan_stub(si: vim.ServiceInstance, host: str, context: ssl.SSLContext,
+                  workers: int = VSAN_QUERY_WORKERS):
     """Get vSAN API stub for advanced queries."""
     if not VSAN_SDK_AVAILABLE:
         return None
     try:
         vsan_stub = vsanapiutils.GetVsanVcMos(si._stub, context=context)
-        return vsan_stub
     except Exception:
         return None
 
+    # All vSAN managed objects share one SOAP stub; keep enough pooled
+    # connections open for the concurrent vSAN queries to reuse
+    try:
+        soap_stub = next(iter(vsan_stub.values()))._stub
+        soap_stub.poolSize = max(soap_stub.poolSize, workers)
+    except Exception:
+        pass
+    return vsan_stub
+
+
+def property_dict(obj_content) -> Dict[str, Any]:
+    """Convert a PropertyCollector ObjectContent into a {path: value} dict."""
+    props = {'obj': obj_content.obj}
+    for prop in obj_content.propSet or []:
+        props[prop.name] = prop.val
+    return props
+
 
-def get_all_clusters(content: vim.ServiceContent) -> List[vim.ClusterComputeResource]:
-    """Get all clusters from vCenter."""
+def collect_properties(content: vim.ServiceContent, filter_spec) -> List[Any]:
+    """
+    Run a PropertyCollector query and return all ObjectContents, following
+    continuation tokens so each response holds at most
+    PROPERTY_COLLECTOR_PAGE_SIZE objects.
+    """
+    collector = content.propertyCollector
+    options = vmodl.query.PropertyCollector.RetrieveOptions(maxObjects=PROPERTY_COLLECTOR_PAGE_SIZE)
+    result = collector.RetrievePropertiesEx([filter_spec], options)
+    contents = []
+    while result is not None:
+        contents.extend(result.objects or [])
+        if not result.token:
+            break
+        result = collector.ContinueRetrievePropertiesEx(result.token)
+    return contents
+
+
+def retrieve_properties(content: vim.ServiceContent,
+                        property_specs: Dict[type, List[str]]) -> Dict[type, List[Dict[str, Any]]]:
+    """
+    Fetch properties for every object of the given types with one PropertyCollector query.
+
+    Reading attributes off managed objects costs a SOAP round-trip per access;
+    this collects all requested paths for the whole inventory at once, through
+    a single container view shared by all types. Returns, per type, one dict
+    per object keyed by property path, with the managed object itself under
+    'obj'. Unset properties are absent from the dict.
+    """
+    obj_types = list(property_specs)
     container = content.viewManager.CreateContainerView(
-        content.rootFolder, [vim.ClusterComputeResource], True
+        content.rootFolder, obj_types, True
+    )
+    try:
+        traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+            name='traverseView', path='view', skip=False, type=vim.view.ContainerView
+        )
+        obj_spec = vmodl.query.PropertyCollector.ObjectSpec(
+            obj=container, skip=True, selectSet=[traversal_spec]
+        )
+        prop_specs = [
+            vmodl.query.PropertyCollector.PropertySpec(type=obj_type, pathSet=path_set, all=False)
+            for obj_type, path_set in property_specs.items()
+        ]
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[obj_spec], propSet=prop_specs
+        )
+        contents = collect_properties(content, filter_spec)
+    finally:
+        container.Destroy()
+
+    results = {obj_type: [] for obj_type in obj_types}
+    for obj_content in contents:
+        props = property_dict(obj_content)
+        for obj_type in obj_types:
+            if isinstance(obj_content.obj, obj_type):
+                results[obj_type].append(props)
+                break
+    return results
+
+
+def retrieve_object_properties(content: vim.ServiceContent, objects: List[Any], obj_type: type,
+                               path_set: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch properties for an explicit list of managed objects with one PropertyCollector query.
+
+    Objects deleted since they were listed are left out of the results
+    instead of failing the whole query with ManagedObjectNotFound.
+    """
+    if not objects:
+        return []
+
+    obj_specs = [vmodl.query.PropertyCollector.ObjectSpec(obj=obj, skip=False) for obj in objects]
+    prop_spec = vmodl.query.PropertyCollector.PropertySpec(type=obj_type, pathSet=path_set, all=False)
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=obj_specs, propSet=[prop_spec], reportMissingObjectsInResults=True
     )
-    clusters = list(container.view)
-    container.Destroy()
+    return [
+        property_dict(obj_content)
+        for obj_content in collect_properties(content, filter_spec)
+        if not any(isinstance(missing.fault, vmodl.fault.ManagedObjectNotFound)
+                   for missing in obj_content.missingSet or [])
+    ]
+
+
+def get_inventory(content: vim.ServiceContent) -> Dict[type, List[Dict[str, Any]]]:
+    """Fetch cluster, host, resource pool and VM properties in one bulk call."""
+    return retrieve_properties(content, {
+        vim.ClusterComputeResource: CLUSTER_PROPERTIES,
+        vim.HostSystem: HOST_PROPERTIES,
+        vim.ResourcePool: RESOURCE_POOL_PROPERTIES,
+        vim.VirtualMachine: VM_PROPERTIES,
+    })
+
+
+def get_resource_pool_clusters(inventory: Dict[type, List[Dict[str, Any]]]) -> Dict[str, str]:
+    """Map resource pool moId -> owning cluster name from get_inventory() results."""
+    cluster_names = {
+        c['obj']._moId: c.get('name', '')
+        for c in inventory[vim.ClusterComputeResource]
+    }
+    rp_clusters = {}
+    for rp in inventory[vim.ResourcePool]:
+        owner = rp.get('owner')
+        if owner is not None and owner._moId in cluster_names:
+            rp_clusters[rp['obj']._moId] = cluster_names[owner._moId]
+    return rp_clusters
+
+
+def get_all_clusters(inventory: Dict[type, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Get cluster property dicts from get_inventory() results.
+
+    Member host names are resolved from the HostSystem results and stored
+    under 'host_names'.
+    """
+    clusters = inventory[vim.ClusterComputeResource]
+    host_names = {
+        h['obj']._moId: h.get('name', '')
+        for h in inventory[vim.HostSystem]
+    }
+    for cluster in clusters:
+        cluster['host_names'] = [host_names.get(h._moId, '') for h in cluster.get('host', [])]
     return clusters
 
 
-def detect_vsan_config(cluster: vim.ClusterComputeResource, vsan_stub=None) -> VSANConfig:
-    """Detect vSAN configuration for a cluster."""
-    config = VSANConfig(cluster_name=cluster.name)
+def detect_vsan_config(cluster: Dict[str, Any], vsan_stub=None,
+                       cache_vcenter: Optional[str] = None, cache_ttl: float = 0,
+                       refresh: bool = False) -> VSANConfig:
+    """
+    Detect vSAN configuration for a cluster property dict from get_all_clusters().
 
-    # Check if vSAN is enabled
-    if not hasattr(cluster, 'configurationEx') or not cluster.configurationEx:
-        return config
+    With cache_vcenter set and a positive cache_ttl, vSAN space usage is read
+    from the on-disk cache while it is fresh instead of being queried. With
+    refresh set the cache is not read but is still rewritten.
+    """
+    cluster_name = cluster.get('name', '')
+    config = VSANConfig(cluster_name=cluster_name)
 
-    vsan_config_info = cluster.configurationEx.vsanConfigInfo
+    # Check if vSAN is enabled
+    config_ex = cluster.get('configurationEx')
+    vsan_config_info = getattr(config_ex, 'vsanConfigInfo', None) if config_ex else None
     if not vsan_config_info or not vsan_config_info.enabled:
         return config
 
     config.is_vsan = True
 
-    # Check for VXRail
-    for host in cluster.host:
-        if 'vxrail' in host.name.lower() or 'vxrail' in cluster.name.lower():
-            config.is_vxrail = True
-            break
+    # Check for VXRail, by cluster name first and then by member host names
+    if VXRAIL_NAME_PATTERN.search(cluster_name):
+        config.is_vxrail = True
+    else:
+        config.is_vxrail = any(
+            VXRAIL_NAME_PATTERN.search(host_name) for host_name in cluster.get('host_names', [])
+        )
 
     # Get space efficiency config (dedup/compression)
     try:
-        if hasattr(vsan_config_info, 'dataEfficiencyConfig'):
-            de_config = vsan_config_info.dataEfficiencyConfig
-            if de_config:
-                config.dedup_enabled = getattr(de_config, 'dedupEnabled', False)
-                config.compression_enabled = getattr(de_config, 'compressionEnabled', False)
+        de_config = getattr(vsan_config_info, 'dataEfficiencyConfig', None)
+        if de_config:
+            config.dedup_enabled = getattr(de_config, 'dedupEnabled', False)
+            config.compression_enabled = getattr(de_config, 'compressionEnabled', False)
     except Exception:
         pass
 
     # Try to get RAID policy from default storage policy
-    config.raid_policy, config.raid_overhead = detect_default_raid_policy(cluster)
+    config.raid_policy, config.raid_overhead = detect_default_raid_policy(vsan_config_info)
 
     # Try to get actual dedup/compression ratios from vSAN API
     if vsan_stub and VSAN_SDK_AVAILABLE:
         try:
-            config = query_vsan_capacity_details(cluster, vsan_stub, config)
+            cache_path = None
+            if cache_vcenter and cache_ttl > 0:
+                cache_path = get_space_usage_cache_path(cache_vcenter, cluster['obj']._moId)
+            config = query_vsan_capacity_details(
+                cluster['obj'], vsan_stub, config, cache_path, cache_ttl, refresh
+            )
         except Exception:
             pass
 
-    return config
+    return compute_estimate_factors(config)
+
 
+def query_vsan_capacity_details(cluster: vim.ClusterComputeResource, vsan_stub, config: VSANConfig,
+                                cache_path: Optional[str] = None, cache_ttl: float = 0,
+                                refresh: bool = False) -> VSANConfig:
+    """
+    Query vSAN Management API for detailed capacity breakdown.
 
-def query_vsan_capacity_details(cluster: vim.ClusterComputeResource, vsan_stub, config: VSANConfig) -> VSANConfig:
-    """Query vSAN Management API for detailed capacity breakdown."""
+    If cache_path is given, a result cached there less than cache_ttl seconds
+    ago is used instead of calling VsanQuerySpaceUsage (unless refresh is
+    set), and a fresh query result is written back to it.
+    """
     if not vsan_stub:
         return config
 
+    space_usage = None
+    if cache_path and not refresh:
+        space_usage = load_fresh_json_cache(cache_path, cache_ttl) or None
+
+    if space_usage is None:
+        space_usage = query_vsan_space_usage(cluster, vsan_stub)
+        if space_usage is None:
+            return config
+        if cache_path:
+            try:
+                save_json_cache(cache_path, space_usage)
+            except OSError:
+                pass
+
+    try:
+        # Extract primary vs overhead capacity
+        if space_usage.get('primaryCapacity') is not None:
+            config.primary_capacity_gb = space_usage['primaryCapacity'] / (1024**3)
+        if space_usage.get('usedCapacity') is not None:
+            config.used_capacity_gb = space_usage['usedCapacity'] / (1024**3)
+        if space_usage.get('dedupRatio'):
+            config.dedup_ratio = space_usage['dedupRatio']
+        if space_usage.get('compressionRatio'):
+            config.compression_ratio = space_usage['compressionRatio']
+    except Exception:
+        pass
+
+    return config
+
+
+def query_vsan_space_usage(cluster: vim.ClusterComputeResource, vsan_stub) -> Optional[Dict[str, Any]]:
+    """
+    Call VsanQuerySpaceUsage for a cluster and flatten the fields used here.
+
+    Returns {primaryCapacity, usedCapacity, dedupRatio, compressionRatio}
+    (any of which may be None), or None if the query fails.
+    """
     try:
         # Get vSAN Space Report System
         vsan_space_report_system = vsan_stub['vsan-cluster-space-report-system']
 
         # Query cluster space usage
         space_usage = vsan_space_report_system.VsanQuerySpaceUsage(cluster=cluster)
+        if not space_usage:
+            return None
+
+        result = {
+            'primaryCapacity': getattr(space_usage, 'primaryCapacity', None),
+            'usedCapacity': getattr(space_usage, 'usedCapacity', None),
+            'dedupRatio': None,
+            'compressionRatio': None,
+        }
+
+        # Get actual dedup/compression ratios if available. Newer vSAN
+        # releases report the measured ratios in spaceEfficiencyRatio;
+        # older ones only expose them on efficientCapacity.
+        for source in ('spaceEfficiencyRatio', 'efficientCapacity'):
+            ratios = getattr(space_usage, source, None)
+            if not ratios:
+                continue
+            dedup_ratio = getattr(ratios, 'dedupRatio', None)
+            compression_ratio = getattr(ratios, 'compressionRatio', None)
+            if dedup_ratio or compression_ratio:
+                result['dedupRatio'] = dedup_ratio
+                result['compressionRatio'] = compression_ratio
+                break
+        return result
+    except Exception:
+        return None
+
+
+def query_vsan_vm_space_usage(cluster: vim.ClusterComputeResource, vsan_stub,
+                              vm_uuids: List[str]) -> Dict[str, Tuple[float, float]]:
+    """
+    Query measured per-VM space usage for one batch of VMs on a vSAN cluster.
+
+    The caller splits each cluster's VMs into batches of at most
+    VSAN_ENTITY_QUERY_BATCH, so this is a single round-trip. Returns
+    instanceUuid -> (used_gb, primary_gb), where used_gb includes
+    replica/parity overhead and primary_gb is the logical data, so no RAID
+    overhead has to be inferred for these VMs.
+    """
+    usage = {}
+    if not vsan_stub or not vm_uuids:
+        return usage
 
-        if space_usage:
-            # Extract primary vs overhead capacity
-            if hasattr(space_usage, 'primaryCapacity'):
-                config.primary_capacity_gb = space_usage.primaryCapacity / (1024**3)
-            if hasattr(space_usage, 'usedCapacity'):
-                config.used_capacity_gb = space_usage.usedCapacity / (1024**3)
-
-            # Get actual dedup/compression ratios if available
-            if hasattr(space_usage, 'efficientCapacity'):
-                efficient = space_usage.efficientCapacity
-                if hasattr(efficient, 'dedupRatio') and efficient.dedupRatio:
-                    config.dedup_ratio = efficient.dedupRatio
-                if hasattr(efficient, 'compressionRatio') and efficient.compressionRatio:
-                    config.compression_ratio = efficient.compressionRatio
+    try:
+        vsan_space_report_system = vsan_stub['vsan-cluster-space-report-system']
+        query_spec = vim.cluster.VsanSpaceQuerySpec(entityType='virtualMachine', entityIds=vm_uuids)
+        entities = vsan_space_report_system.VsanQueryEntitySpaceUsage(
+            cluster=cluster, querySpec=query_spec
+        )
     except Exception:
-        pass
+        return usage
 
-    return config
+    for entity in entities or []:
+        used = 0
+        primary = 0
+        for summary in getattr(entity, 'spaceUsageByObjectType', None) or []:
+            used += getattr(summary, 'physicalUsedB', 0) or 0
+            primary += getattr(summary, 'primaryCapacityB', 0) or 0
+        if used > 0 and primary > 0:
+            usage[entity.entityId] = (used / (1024**3), primary / (1024**3))
 
+    return usage
 
-def detect_default_raid_policy(cluster: vim.ClusterComputeResource) -> Tuple[str, float]:
+
+def detect_default_raid_policy(vsan_config_info) -> Tuple[str, float]:
     """
     Detect the default/most common RAID policy for the cluster.
 
+    Takes the cluster's already-fetched configurationEx.vsanConfigInfo.
     In practice, you'd query SPBM (Storage Policy Based Management) to get
     the actual policies in use. This is a simplified detection.
     """
-    # Check cluster configuration for hints
+    # Check if FTT is configured at cluster level
     try:
-        if hasattr(cluster.configurationEx, 'vsanConfigInfo'):
-            vsan_info = cluster.configurationEx.vsanConfigInfo
-            # Check if FTT is configured at cluster level
-            if hasattr(vsan_info, 'defaultConfig'):
-                default_config = vsan_info.defaultConfig
-                if hasattr(default_config, 'hostFailuresToTolerate'):
-                    ftt = default_config.hostFailuresToTolerate
-                    # Check if using erasure coding
-                    if hasattr(default_config, 'spaceEfficiency') and default_config.spaceEfficiency:
-                        if ftt == 1:
-                            return 'RAID-5 (FTT=1)', 1.33
-                        elif ftt == 2:
-                            return 'RAID-6 (FTT=2)', 1.5
-                    else:
-                        if ftt == 1:
-                            return 'RAID-1 (FTT=1)', 2.0
-                        elif ftt == 2:
-                            return 'RAID-1 (FTT=2)', 3.0
-                        elif ftt == 3:
-                            return 'RAID-1 (FTT=3)', 4.0
+        default_config = getattr(vsan_config_info, 'defaultConfig', None)
+        ftt = getattr(default_config, 'hostFailuresToTolerate', None)
+        if ftt is not None:
+            # Check if using erasure coding
+            erasure = bool(getattr(default_config, 'spaceEfficiency', False))
+            policy = RAID_POLICY_BY_FTT.get((ftt, erasure))
+            if policy:
+                return policy, RAID_OVERHEAD[policy]
     except Exception:
         pass
 
     # Default to RAID-1 FTT=1 (most common)
-    return 'RAID-1 (FTT=1)', 2.0
+    return 'RAID-1 (FTT=1)', RAID_OVERHEAD['RAID-1 (FTT=1)']
 
 
-def get_vm_storage_info(vm: vim.VirtualMachine, vsan_configs: Dict[str, VSANConfig]) -> Optional[VMInfo]:
-    """Get storage information for a VM with organic factor adjustments."""
-    if vm.config is None:
-        return None
+def get_vm_storage_info(vm_props: Dict[str, Any], vsan_configs: Dict[str, VSANConfig],
+                        vsan_usage: Optional[Dict[str, Tuple[float, float]]] = None) -> Optional[VMInfo]:
+    """
+    Get storage information for a VM with organic factor adjustments.
 
-    vm_info = VMInfo(name=vm.name, cluster="")
+    vm_props is a property dict from get_all_vms(); no managed object
+    attributes are read here, so this makes no vCenter round-trips.
+    vsan_usage holds measured usage from query_vsan_vm_space_usage(), which
+    takes precedence over the vCenter committed size when present.
+    """
+    # VMs without a config (e.g. still being created) report no template flag
+    if 'config.template' not in vm_props:
+        return None
 
-    # Get cluster name
-    if vm.resourcePool and vm.resourcePool.owner:
-        if isinstance(vm.resourcePool.owner, vim.ClusterComputeResource):
-            vm_info.cluster = vm.resourcePool.owner.name
+    vm_info = VMInfo(name=vm_props.get('name', ''), cluster=vm_props.get('cluster', ""))
 
     # Check for snapshots
-    if vm.snapshot:
+    if vm_props.get('rootSnapshot'):
         vm_info.has_snapshots = True
 
-    # Calculate storage from per-datastore usage
-    provisioned = 0
-    committed = 0
-
-    try:
-        if vm.storage and vm.storage.perDatastoreUsage:
-            for ds_usage in vm.storage.perDatastoreUsage:
-                provisioned += ds_usage.committed + ds_usage.uncommitted
-                committed += ds_usage.committed
-    except Exception:
-        # Fallback to summary
-        if vm.summary and vm.summary.storage:
-            provisioned = vm.summary.storage.committed + vm.summary.storage.uncommitted
-            committed = vm.summary.storage.committed
-
-    vm_info.provisioned_gb = provisioned / (1024**3)
+    committed, uncommitted = get_vm_storage_totals(vm_props)
+    vm_info.provisioned_gb = (committed + uncommitted) / (1024**3)
     vm_info.used_gb = committed / (1024**3)
 
+    # Prefer vSAN's measured usage, which already separates primary data
+    measured_logical_gb = None
+    if vsan_usage:
+        measured = vsan_usage.get(vm_props.get('config.instanceUuid'))
+        if measured:
+            vm_info.used_gb, measured_logical_gb = measured
+
     # Calculate estimate based on cluster config and organic factors
     if vm_info.cluster in vsan_configs:
         config = vsan_configs[vm_info.cluster]
         if config.is_vsan:
             vm_info.logical_gb, vm_info.estimated_gb, vm_info.change_pct, vm_info.notes = calculate_estimate(
-                vm_info.used_gb, vm_info.has_snapshots, config
+                vm_info.used_gb, vm_info.has_snapshots, config, measured_logical_gb
             )
         else:
             vm_info.logical_gb = vm_info.used_gb
@@ -340,41 +660,38 @@ def get_vm_storage_info(vm: vim.VirtualMachine, vsan_configs: Dict[str, VSANConf
     return vm_info
 
 
-def calculate_estimate(used_gb: float, has_snapshots: bool, config: VSANConfig) -> Tuple[float, float, float, str]:
+def compute_estimate_factors(config: VSANConfig) -> VSANConfig:
     """
-    Calculate estimated migration size accounting for organic factors.
+    Fold the cluster-wide adjustments into per-VM multipliers.
+
+    Everything except snapshot consolidation depends only on the cluster
+    configuration, so it is computed once per cluster here rather than once
+    per VM in calculate_estimate().
 
     The calculation flow:
-    1. Start with vCenter reported "used" size (includes RAID overhead)
-    2. Divide by RAID overhead to get primary/logical data
-    3. Apply TRIM/UNMAP adjustment (unreclaimred blocks inflation)
-    4. Apply dedup expansion (if dedup enabled)
-    5. Apply compression expansion (if compression enabled)
-    6. Apply snapshot/VM overhead adjustments
+    1. Divide by RAID overhead to get primary/logical data
+    2. Apply TRIM/UNMAP adjustment (unreclaimred blocks inflation)
+    3. Apply dedup expansion (if dedup enabled)
+    4. Apply compression expansion (if compression enabled)
+    5. Apply VM swap overhead adjustment
 
-    Returns: (logical_gb, estimated_gb, change_pct, notes)
+    Steps 1-2 are skipped for VMs whose primary data was measured by vSAN.
     """
-    notes_parts = []
+    logical_notes = []
+    expansion_notes = []
 
-    # Step 1: Start with reported used size
-    size = used_gb
-
-    # Step 2: Remove RAID overhead to get logical/primary data
+    # Remove RAID overhead to get logical/primary data
     # vCenter's "committed" on vSAN includes replica/parity overhead
-    logical_size = size / config.raid_overhead
-    notes_parts.append(f"Primary data (/{config.raid_overhead:.2f} RAID)")
+    logical_factor = 1.0 / config.raid_overhead
+    logical_notes.append(f"Primary data (/{config.raid_overhead:.2f} RAID)")
 
-    # Step 3: TRIM/UNMAP adjustment
+    # TRIM/UNMAP adjustment
     # If not known to be enabled, assume some inflation
     if not config.trim_unmap_enabled:
-        logical_size *= ORGANIC_FACTORS['trim_unmap_not_enabled']
-        notes_parts.append("TRIM/UNMAP adj")
-
-    # The logical size after RAID removal represents the actual VM data
-    logical_gb = logical_size
+        logical_factor *= ORGANIC_FACTORS['trim_unmap_not_enabled']
+        logical_notes.append("TRIM/UNMAP adj")
 
-    # Step 4: Calculate migration size (data expansion factors)
-    estimated_size = logical_size
+    expansion_factor = 1.0
 
     # Dedup expansion: deduplicated data will expand on target
     if config.dedup_enabled:
@@ -384,8 +701,8 @@ def calculate_estimate(used_gb: float, has_snapshots: bool, config: VSANConfig)
         else:
             # Use conservative estimate based on typical workloads
             expansion = ORGANIC_FACTORS['dedup_expansion_medium']
-        estimated_size *= expansion
-        notes_parts.append(f"Dedup expand x{expansion:.2f}")
+        expansion_factor *= expansion
+        expansion_notes.append(f"Dedup expand x{expansion:.2f}")
 
     # Compression expansion
     if config.compression_enabled:
@@ -393,54 +710,210 @@ def calculate_estimate(used_gb: float, has_snapshots: bool, config: VSANConfig)
             expansion = config.compression_ratio
         else:
             expansion = ORGANIC_FACTORS['compression_expansion']
-        estimated_size *= expansion
-        notes_parts.append(f"Compress expand x{expansion:.2f}")
+        expansion_factor *= expansion
+        expansion_notes.append(f"Compress expand x{expansion:.2f}")
 
-    # Step 5: VM overhead adjustments
     # Swap files don't need to migrate (regenerated on target)
-    estimated_size *= ORGANIC_FACTORS['vm_swap_overhead']
+    expansion_factor *= ORGANIC_FACTORS['vm_swap_overhead']
+
+    config.logical_factor = logical_factor
+    config.expansion_factor = expansion_factor
+    config.estimate_factor = logical_factor * expansion_factor
+
+    snapshot_note = ["Snapshot consolidation"]
+    measured_notes = ["Primary data (vSAN measured)"]
+    config.estimate_notes = "; ".join(logical_notes + expansion_notes)
+    config.snapshot_notes = "; ".join(logical_notes + expansion_notes + snapshot_note)
+    config.measured_notes = "; ".join(measured_notes + expansion_notes)
+    config.measured_snapshot_notes = "; ".join(measured_notes + expansion_notes + snapshot_note)
+    return config
+
+
+def calculate_estimate(used_gb: float, has_snapshots: bool, config: VSANConfig,
+                       logical_gb: Optional[float] = None) -> Tuple[float, float, float, str]:
+    """
+    Calculate estimated migration size accounting for organic factors.
+
+    Starts from the vCenter reported "used" size (includes RAID overhead) and
+    applies the cluster multipliers from compute_estimate_factors(), plus the
+    snapshot consolidation adjustment which is the only per-VM factor.
+
+    If logical_gb is given (primary data measured by vSAN), the RAID and
+    TRIM/UNMAP steps are skipped and only the expansion factors are applied.
+
+    Returns: (logical_gb, estimated_gb, change_pct, notes)
+    """
+    if logical_gb is None:
+        logical_gb = used_gb * config.logical_factor
+        estimated_size = used_gb * config.estimate_factor
+        notes, snapshot_notes = config.estimate_notes, config.snapshot_notes
+    else:
+        estimated_size = logical_gb * config.expansion_factor
+        notes, snapshot_notes = config.measured_notes, config.measured_snapshot_notes
 
     # Snapshots consolidate during migration
     if has_snapshots:
-        estimated_size *= ORGANIC_FACTORS['snapshot_overhead']
-        notes_parts.append("Snapshot consolidation")
+        estimated_size *= SNAPSHOT_OVERHEAD
+        notes = snapshot_notes
 
-    # Final values
-    estimated_gb = round(estimated_size, 2)
-    logical_gb = round(logical_gb, 2)
-    change_pct = round((estimated_gb - used_gb) / used_gb * 100, 1) if used_gb > 0 else 0
-    notes = "; ".join(notes_parts)
+    # Final values (left unrounded; they are formatted on output)
+    estimated_gb = estimated_size
+    change_pct = (estimated_gb - used_gb) / used_gb * 100 if used_gb > 0 else 0
 
     return logical_gb, estimated_gb, change_pct, notes
 
 
-def get_all_vms(content: vim.ServiceContent) -> List[vim.VirtualMachine]:
-    """Get all VMs from vCenter."""
-    container = content.viewManager.CreateContainerView(
-        content.rootFolder, [vim.VirtualMachine], True
+def get_vm_storage_totals(vm_props: Dict[str, Any]) -> Tuple[int, int]:
+    """Return (committed, uncommitted) bytes from a VM's storage properties."""
+    # summary.storage already totals usage across all datastores
+    return vm_props.get('summary.storage.committed', 0), vm_props.get('summary.storage.uncommitted', 0)
+
+
+def get_vm_cache_path(vcenter: str) -> str:
+    """Get the --incremental cache file for a vCenter."""
+    clean_name = vcenter.replace('.', '_').replace(':', '_')
+    return os.path.join(CACHE_DIR, f"{clean_name}_vms.json")
+
+
+def get_space_usage_cache_path(vcenter: str, cluster_moid: str) -> str:
+    """Get the vSAN space usage cache file for a cluster."""
+    clean_name = vcenter.replace('.', '_').replace(':', '_')
+    return os.path.join(CACHE_DIR, f"{clean_name}_{cluster_moid}_space.json")
+
+
+def load_fresh_json_cache(path: str, ttl: float) -> Dict[str, Any]:
+    """Load a JSON cache file if it was written less than ttl seconds ago, else return {}."""
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return {}
+    except OSError:
+        return {}
+    return load_json_cache(path)
+
+
+def load_json_cache(path: str) -> Dict[str, Any]:
+    """Load a JSON cache file; a missing or unreadable cache is treated as empty."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        cache = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_json_cache(path: str, cache: Dict[str, Any]):
+    """Write a JSON cache file, replacing the previous file atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(cache) if ORJSON_AVAILABLE else json.dumps(cache).encode())
+    os.replace(tmp_path, path)
+
+
+def apply_vm_cache(vms: List[Dict[str, Any]], cache: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Fill in storage properties from the cache for VMs whose config.changeVersion
+    and committed size are unchanged since the cached run.
+
+    changeVersion alone misses disk growth from guest writes, so the committed
+    size from the inventory fetch must match the cached one as well.
+
+    Returns the VMs that were not served from the cache and still need
+    load_vm_storage_properties().
+    """
+    missing = []
+    for vm_props in vms:
+        entry = cache.get(vm_props.get('config.instanceUuid'))
+        change_version = vm_props.get('config.changeVersion')
+        if (entry and change_version and entry.get('changeVersion') == change_version
+                and entry.get('committed') == vm_props.get('summary.storage.committed')):
+            vm_props['rootSnapshot'] = entry['snapshot']
+            vm_props['summary.storage.uncommitted'] = entry['uncommitted']
+        else:
+            missing.append(vm_props)
+    return missing
+
+
+def update_vm_cache(vms: List[Dict[str, Any]], cache: Dict[str, Dict[str, Any]]):
+    """Record the storage details of the given VMs in the cache."""
+    for vm_props in vms:
+        vm_uuid = vm_props.get('config.instanceUuid')
+        change_version = vm_props.get('config.changeVersion')
+        if not vm_uuid or not change_version:
+            continue
+        committed, uncommitted = get_vm_storage_totals(vm_props)
+        cache[vm_uuid] = {
+            'changeVersion': change_version,
+            'snapshot': bool(vm_props.get('rootSnapshot')),
+            'committed': committed,
+            'uncommitted': uncommitted,
+        }
+
+
+def prune_vm_cache(vms: List[Dict[str, Any]], cache: Dict[str, Dict[str, Any]]):
+    """Drop cache entries for VMs no longer in the inventory (deleted or re-created)."""
+    inventory_uuids = {vm_props.get('config.instanceUuid') for vm_props in vms}
+    for vm_uuid in [vm_uuid for vm_uuid in cache if vm_uuid not in inventory_uuids]:
+        del cache[vm_uuid]
+
+
+def load_vm_storage_properties(content: vim.ServiceContent, vms: List[Dict[str, Any]]) -> set:
+    """
+    Fetch VM_STORAGE_PROPERTIES for the given VMs and merge them into their property dicts.
+
+    Returns the moIds of VMs that were deleted since the inventory fetch.
+    """
+    vms_by_id = {vm['obj']._moId: vm for vm in vms}
+    storage_props = retrieve_object_properties(
+        content, [vm['obj'] for vm in vms], vim.VirtualMachine, VM_STORAGE_PROPERTIES
     )
-    vms = list(container.view)
-    container.Destroy()
+    deleted = set(vms_by_id)
+    for props in storage_props:
+        vm = vms_by_id.get(props['obj']._moId)
+        if vm is not None:
+            vm.update(props)
+            deleted.discard(props['obj']._moId)
+    return deleted
+
+
+def get_all_vms(inventory: Dict[type, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Get VM property dicts from get_inventory() results.
+
+    The owning cluster name is resolved through the VM's resource pool and
+    stored under 'cluster' ("" if the VM is not in a cluster).
+    """
+    vms = inventory[vim.VirtualMachine]
+    rp_clusters = get_resource_pool_clusters(inventory)
+    for vm_props in vms:
+        resource_pool = vm_props.get('resourcePool')
+        vm_props['cluster'] = rp_clusters.get(resource_pool._moId, "") if resource_pool is not None else ""
     return vms
 
 
 def print_cluster_summary(vsan_configs: Dict[str, VSANConfig]):
-    """Print summary of detected vSAN clusters."""
-    print("\n" + "=" * 70, file=sys.stderr)
-    print("DETECTED vSAN CLUSTERS", file=sys.stderr)
-    print("=" * 70, file=sys.stderr)
+    """Print summary of detected vSAN clusters (built up and written to stderr in one call)."""
+    lines = [
+        "",
+        "=" * 70,
+        "DETECTED vSAN CLUSTERS",
+        "=" * 70,
+    ]
 
     for name, config in vsan_configs.items():
         if config.is_vsan:
-            print(f"\nCluster: {name}", file=sys.stderr)
-            print(f"  Type: {'VXRail' if config.is_vxrail else 'vSAN'}", file=sys.stderr)
-            print(f"  RAID Policy: {config.raid_policy} ({config.raid_overhead}x overhead)", file=sys.stderr)
-            print(f"  Deduplication: {'Enabled' if config.dedup_enabled else 'Disabled'}", file=sys.stderr)
+            lines.append("")
+            lines.append(f"Cluster: {name}")
+            lines.append(f"  Type: {'VXRail' if config.is_vxrail else 'vSAN'}")
+            lines.append(f"  RAID Policy: {config.raid_policy} ({config.raid_overhead}x overhead)")
+            lines.append(f"  Deduplication: {'Enabled' if config.dedup_enabled else 'Disabled'}")
             if config.dedup_enabled and config.dedup_ratio > 1.0:
-                print(f"    Detected ratio: {config.dedup_ratio:.2f}:1", file=sys.stderr)
-            print(f"  Compression: {'Enabled' if config.compression_enabled else 'Disabled'}", file=sys.stderr)
+                lines.append(f"    Detected ratio: {config.dedup_ratio:.2f}:1")
+            lines.append(f"  Compression: {'Enabled' if config.compression_enabled else 'Disabled'}")
             if config.compression_enabled and config.compression_ratio > 1.0:
-                print(f"    Detected ratio: {config.compression_ratio:.2f}:1", file=sys.stderr)
+                lines.append(f"    Detected ratio: {config.compression_ratio:.2f}:1")
+    sys.stderr.write("\n".join(lines) + "\n")
 
 
 def get_script_dir() -> str:
@@ -455,7 +928,185 @@ def generate_output_filename(vcenter: str) -> str:
     return f"vxrail_estimate_{clean_name}_{timestamp}.csv"
 
 
+def collect_from_vcenter(args, password: str) -> Tuple[List[Dict[str, Any]], Dict[str, VSANConfig],
+                                                       Dict[str, Tuple[float, float]]]:
+    """
+    Connect to vCenter and gather everything the estimate needs.
+
+    Returns (selected VM property dicts, vSAN config per cluster name,
+    measured vSAN usage per VM instance UUID). All vCenter and vSAN I/O
+    happens here; the estimate itself works only on the returned values.
+    """
+    # Only needed for collection, so not imported at module level (see main())
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Connect to vCenter
+    print(f"Connecting to vCenter: {args.vcenter}...", file=sys.stderr)
+    context = create_ssl_context()
+    si = connect_to_vcenter(args.vcenter, args.username, password, args.port, context)
+    content = si.RetrieveContent()
+    print("Connected successfully.", file=sys.stderr)
+
+    # Check for vSAN SDK
+    if VSAN_SDK_AVAILABLE:
+        print("vSAN Management SDK detected - using advanced capacity queries", file=sys.stderr)
+        vsan_stub = get_vsan_stub(si, args.vcenter, context, args.workers)
+    else:
+        print("vSAN Management SDK not found - using heuristic estimation", file=sys.stderr)
+        vsan_stub = None
+
+    # Fetch clusters, hosts, resource pools and VMs in one bulk call
+    print("Retrieving vCenter inventory...", file=sys.stderr)
+    inventory = get_inventory(content)
+
+    # Get all VMs
+    vms = get_all_vms(inventory)
+    print(f"  Found {len(vms)} VMs", file=sys.stderr)
+
+    # Loop invariants, resolved once instead of per VM
+    include_templates = args.include_templates
+    include_powered_off = args.include_powered_off
+    powered_on = vim.VirtualMachinePowerState.poweredOn
+
+    selected = []
+    for vm_props in vms:
+        # Skip templates unless requested
+        if not include_templates and vm_props.get('config.template'):
+            continue
+
+        # Skip powered-off unless requested
+        if not include_powered_off and vm_props.get('runtime.powerState') != powered_on:
+            continue
+
+        selected.append(vm_props)
+
+    # Detect vSAN config, only for clusters hosting at least one selected VM
+    print("Detecting vSAN cluster configurations...", file=sys.stderr)
+    needed_clusters = {vm_props['cluster'] for vm_props in selected}
+    clusters = [c for c in get_all_clusters(inventory) if c.get('name') in needed_clusters]
+    vsan_configs = {}
+    cluster_refs = {}
+    found_lines = []
+    # --refresh-cache also re-queries vSAN space usage (and rewrites its
+    # cache), so the rewritten snapshot holds current ratios
+    cache_ttl = 0 if args.no_cache else args.cache_ttl
+    # Detection is network-bound (vSAN space queries), so run clusters concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(clusters)))) as executor:
+        configs = list(executor.map(
+            lambda c: detect_vsan_config(c, vsan_stub, args.vcenter, cache_ttl, args.refresh_cache), clusters
+        ))
+    for cluster, config in zip(clusters, configs):
+        vsan_configs[config.cluster_name] = config
+        cluster_refs[config.cluster_name] = cluster['obj']
+        if config.is_vsan:
+            cluster_type = 'VXRail' if config.is_vxrail else 'vSAN'
+            found_lines.append(f"  Found {cluster_type} cluster: {config.cluster_name}\n")
+    sys.stderr.write("".join(found_lines))
+
+    # Print cluster summary
+    print_cluster_summary(vsan_configs)
+
+    # Storage details are only fetched for the VMs that will be reported,
+    # and with --incremental only for those changed or grown since the cached run
+    print("\nCollecting VM storage information...", file=sys.stderr)
+    if args.incremental:
+        cache_path = get_vm_cache_path(args.vcenter)
+        vm_cache = load_json_cache(cache_path)
+        to_fetch = apply_vm_cache(selected, vm_cache)
+        print(f"  Reusing cached storage details for {len(selected) - len(to_fetch)} VMs", file=sys.stderr)
+        deleted = load_vm_storage_properties(content, to_fetch)
+        update_vm_cache([vm for vm in to_fetch if vm['obj']._moId not in deleted], vm_cache)
+        # Keep entries for filtered-out VMs (templates, powered off), which
+        # are still in the inventory
+        prune_vm_cache(vms, vm_cache)
+        try:
+            save_json_cache(cache_path, vm_cache)
+        except OSError as e:
+            print(f"  Warning: could not write cache {cache_path}: {e}", file=sys.stderr)
+    else:
+        deleted = load_vm_storage_properties(content, selected)
+    if deleted:
+        print(f"  Skipping {len(deleted)} VMs deleted during collection", file=sys.stderr)
+        selected = [vm for vm in selected if vm['obj']._moId not in deleted]
+
+    # Measured per-VM usage from vSAN, queried in batches per cluster
+    vsan_usage = {}
+    if vsan_stub:
+        uuids_by_cluster = {}
+        for vm_props in selected:
+            vm_uuid = vm_props.get('config.instanceUuid')
+            if not vm_uuid:
+                continue
+            cluster_name = vm_props['cluster']
+            if cluster_name in vsan_configs and vsan_configs[cluster_name].is_vsan:
+                uuids_by_cluster.setdefault(cluster_name, []).append(vm_uuid)
+        # One task per cluster batch; batches are independent RPCs
+        batches = [
+            (cluster_refs[cluster_name], vm_uuids[start:start + VSAN_ENTITY_QUERY_BATCH])
+            for cluster_name, vm_uuids in uuids_by_cluster.items()
+            for start in range(0, len(vm_uuids), VSAN_ENTITY_QUERY_BATCH)
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(batches)))) as executor:
+            for batch_usage in executor.map(lambda b: query_vsan_vm_space_usage(b[0], vsan_stub, b[1]), batches):
+                vsan_usage.update(batch_usage)
+
+    return selected, vsan_configs, vsan_usage
+
+
+def get_inventory_cache_path(vcenter: str) -> str:
+    """Get the --use-cache inventory snapshot file for a vCenter."""
+    clean_name = vcenter.replace('.', '_').replace(':', '_')
+    return os.path.join(CACHE_DIR, f"{clean_name}_inventory.json")
+
+
+def save_inventory_snapshot(path: str, args, selected: List[Dict[str, Any]],
+                            vsan_configs: Dict[str, VSANConfig],
+                            vsan_usage: Dict[str, Tuple[float, float]]):
+    """Write the results of collect_from_vcenter() as a JSON snapshot for --use-cache."""
+    vms = []
+    for vm_props in selected:
+        vm = {key: vm_props[key] for key in INVENTORY_SNAPSHOT_VM_KEYS if key in vm_props}
+        vm['rootSnapshot'] = bool(vm_props.get('rootSnapshot'))
+        vms.append(vm)
+    save_json_cache(path, {
+        'include_templates': args.include_templates,
+        'include_powered_off': args.include_powered_off,
+        'clusters': [asdict(config) for config in vsan_configs.values()],
+        'vms': vms,
+        'vsan_usage': vsan_usage,
+    })
+
+
+def load_inventory_snapshot(path: str, args) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, VSANConfig],
+                                                               Dict[str, Tuple[float, float]]]]:
+    """
+    Load a snapshot written by save_inventory_snapshot().
+
+    Returns None if the snapshot is missing, older than --cache-ttl, or was
+    taken with different template/power-state filters.
+    """
+    snapshot = load_fresh_json_cache(path, args.cache_ttl)
+    if (not snapshot
+            or snapshot.get('include_templates') != args.include_templates
+            or snapshot.get('include_powered_off') != args.include_powered_off):
+        return None
+    try:
+        vsan_configs = {}
+        for fields in snapshot['clusters']:
+            config = VSANConfig(**fields)
+            vsan_configs[config.cluster_name] = config
+        return snapshot['vms'], vsan_configs, snapshot['vsan_usage']
+    except (KeyError, TypeError):
+        return None
+
+
 def main():
+    # CLI-only modules are imported here so importing this file as a
+    # library (e.g. to reuse calculate_estimate) does not pay for them
+    import argparse
+    import csv
+    import getpass
+
     parser = argparse.ArgumentParser(
         description="VXRail to ESXi Size Estimator - Connects to vCenter to estimate migration sizes",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -471,6 +1122,8 @@ Examples:
   %(prog)s --vcenter vcenter.example.com --username admin@vsphere.local
   %(prog)s --vcenter vcenter.example.com --username admin -o custom_name.csv
   %(prog)s --vcenter vcenter.example.com --username admin --include-powered-off
+  %(prog)s --vcenter vcenter.example.com --username admin --incremental
+  %(prog)s --vcenter vcenter.example.com --username admin --use-cache
 
 Output:
   CSV file saved to script directory: vxrail_estimate_<vcenter>_<timestamp>.csv
@@ -491,76 +1144,55 @@ Output:
                        help="Include powered-off VMs")
     parser.add_argument("--include-templates", action="store_true",
                        help="Include VM templates")
+    parser.add_argument("--no-sort", action="store_true",
+                       help="Write CSV rows in inventory order as they are processed "
+                            "instead of sorting by VM name (lower memory on large inventories)")
+    parser.add_argument("--incremental", action="store_true",
+                       help="Reuse storage details cached by a previous run for VMs whose "
+                            "configuration has not changed (cache in ~/.cache/vxrail_estimator)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always query vSAN cluster space usage instead of reusing its cache "
+                            "(the --use-cache inventory snapshot is not affected)")
+    parser.add_argument("--cache-ttl", type=int, default=CACHE_TTL,
+                       help=f"Seconds to reuse cached vSAN cluster space usage and --use-cache "
+                            f"inventory snapshots (default: {CACHE_TTL})")
+    parser.add_argument("--use-cache", action="store_true",
+                       help="Reuse a cached inventory snapshot from a previous --use-cache run "
+                            "without connecting to vCenter, if it is within --cache-ttl")
+    parser.add_argument("--refresh-cache", action="store_true",
+                       help="Fetch from vCenter, without reusing cached vSAN space usage, and "
+                            "rewrite the --use-cache inventory snapshot")
+    parser.add_argument("--workers", type=int, default=VSAN_QUERY_WORKERS,
+                       help=f"Concurrent vSAN API requests (default: {VSAN_QUERY_WORKERS})")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Show detailed output")
 
     args = parser.parse_args()
-
-    # Get password if not provided
-    password = args.password
-    if not password:
-        password = getpass.getpass(f"Password for {args.username}@{args.vcenter}: ")
-
-    # Connect to vCenter
-    print(f"Connecting to vCenter: {args.vcenter}...", file=sys.stderr)
-    si = connect_to_vcenter(args.vcenter, args.username, password, args.port)
-    content = si.RetrieveContent()
-    print("Connected successfully.", file=sys.stderr)
-
-    # Check for vSAN SDK
-    if VSAN_SDK_AVAILABLE:
-        print("vSAN Management SDK detected - using advanced capacity queries", file=sys.stderr)
-        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-        vsan_stub = get_vsan_stub(si, args.vcenter, context)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    # With --use-cache, a fresh inventory snapshot replaces the vCenter connection
+    snapshot_path = get_inventory_cache_path(args.vcenter)
+    snapshot = None
+    if args.use_cache and not args.refresh_cache:
+        snapshot = load_inventory_snapshot(snapshot_path, args)
+
+    if snapshot is not None:
+        print(f"Using cached vCenter inventory: {snapshot_path}", file=sys.stderr)
+        selected, vsan_configs, vsan_usage = snapshot
+        print_cluster_summary(vsan_configs)
     else:
-        print("vSAN Management SDK not found - using heuristic estimation", file=sys.stderr)
-        vsan_stub = None
-
-    # Get all clusters and detect vSAN config
-    print("Detecting vSAN cluster configurations...", file=sys.stderr)
-    clusters = get_all_clusters(content)
-    vsan_configs = {}
-    for cluster in clusters:
-        config = detect_vsan_config(cluster, vsan_stub)
-        vsan_configs[cluster.name] = config
-        if config.is_vsan:
-            cluster_type = 'VXRail' if config.is_vxrail else 'vSAN'
-            print(f"  Found {cluster_type} cluster: {cluster.name}", file=sys.stderr)
-
-    # Print cluster summary
-    print_cluster_summary(vsan_configs)
-
-    # Get all VMs
-    print("\nCollecting VM storage information...", file=sys.stderr)
-    vms = get_all_vms(content)
-    print(f"  Found {len(vms)} VMs", file=sys.stderr)
-
-    # Process VMs
-    results = []
-    total_used = 0
-    total_logical = 0
-    total_estimated = 0
-
-    for vm in vms:
-        # Skip templates unless requested
-        if vm.config and vm.config.template and not args.include_templates:
-            continue
-
-        # Skip powered-off unless requested
-        if vm.runtime.powerState != vim.VirtualMachinePowerState.poweredOn and not args.include_powered_off:
-            continue
-
-        vm_info = get_vm_storage_info(vm, vsan_configs)
-        if vm_info and vm_info.used_gb > 0:
-            results.append(vm_info)
-            total_used += vm_info.used_gb
-            total_logical += vm_info.logical_gb
-            total_estimated += vm_info.estimated_gb
-
-    # Sort by name
-    results.sort(key=lambda x: x.name.lower())
+        # Get password if not provided
+        password = args.password
+        if not password:
+            password = getpass.getpass(f"Password for {args.username}@{args.vcenter}: ")
+
+        selected, vsan_configs, vsan_usage = collect_from_vcenter(args, password)
+        if args.use_cache or args.refresh_cache:
+            try:
+                save_inventory_snapshot(snapshot_path, args, selected, vsan_configs, vsan_usage)
+            except OSError as e:
+                print(f"  Warning: could not write cache {snapshot_path}: {e}", file=sys.stderr)
 
     # Determine output file path
     script_dir = get_script_dir()
@@ -572,39 +1204,72 @@ Output:
     else:
         output_path = os.path.join(script_dir, generate_output_filename(args.vcenter))
 
-    # Write CSV output
-    with open(output_path, 'w', newline='') as f:
+    # Process VMs. Only the CSV row is kept per VM (and only when sorting);
+    # the VMInfo is dropped as soon as its totals have been accumulated.
+    rows = []
+    total_used = 0
+    total_logical = 0
+    total_estimated = 0
+
+    # Write CSV output. With --no-sort each row is written as soon as it is
+    # computed; otherwise rows are collected and sorted by name first.
+    vm_count = 0
+    with open(output_path, 'w', newline='', buffering=CSV_WRITE_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow(['host', 'cluster', 'vsan_used_gb', 'logical_gb', 'est_esxi_gb', 'change_pct', 'notes'])
-        for r in results:
-            writer.writerow([
-                r.name, r.cluster, round(r.used_gb, 2), r.logical_gb,
-                r.estimated_gb, r.change_pct, r.notes
-            ])
+
+        for vm_props in selected:
+            vm_info = get_vm_storage_info(vm_props, vsan_configs, vsan_usage)
+            if vm_info and vm_info.used_gb > 0:
+                row = (
+                    vm_info.name, vm_info.cluster, f"{vm_info.used_gb:.2f}", f"{vm_info.logical_gb:.2f}",
+                    f"{vm_info.estimated_gb:.2f}", f"{vm_info.change_pct:.1f}", vm_info.notes
+                )
+                if args.no_sort:
+                    writer.writerow(row)
+                else:
+                    rows.append(row)
+                vm_count += 1
+                total_used += vm_info.used_gb
+                total_logical += vm_info.logical_gb
+                total_estimated += vm_info.estimated_gb
+
+        # Sort by name
+        if rows:
+            rows.sort(key=lambda r: r[0].lower())
+            writer.writerows(rows)
+
     print(f"\nCSV output written to: {output_path}", file=sys.stderr)
 
-    # Print summary
-    print("\n" + "=" * 70, file=sys.stderr)
-    print("MIGRATION ESTIMATE SUMMARY", file=sys.stderr)
-    print("=" * 70, file=sys.stderr)
-    print(f"Total VMs processed: {len(results)}", file=sys.stderr)
-    print(f"\nStorage breakdown:", file=sys.stderr)
-    print(f"  vSAN used (with RAID overhead): {total_used:,.2f} GB ({total_used/1024:.2f} TB)", file=sys.stderr)
-    print(f"  Logical/primary data:           {total_logical:,.2f} GB ({total_logical/1024:.2f} TB)", file=sys.stderr)
-    print(f"  Estimated ESXi size:            {total_estimated:,.2f} GB ({total_estimated/1024:.2f} TB)", file=sys.stderr)
+    # Print summary (built up and written to stderr in one call)
+    lines = [
+        "",
+        "=" * 70,
+        "MIGRATION ESTIMATE SUMMARY",
+        "=" * 70,
+        f"Total VMs processed: {vm_count}",
+        "",
+        "Storage breakdown:",
+        f"  vSAN used (with RAID overhead): {total_used:,.2f} GB ({total_used/1024:.2f} TB)",
+        f"  Logical/primary data:           {total_logical:,.2f} GB ({total_logical/1024:.2f} TB)",
+        f"  Estimated ESXi size:            {total_estimated:,.2f} GB ({total_estimated/1024:.2f} TB)",
+    ]
 
     change = total_estimated - total_used
     change_pct = (change / total_used) * 100 if total_used > 0 else 0
-    print(f"\nMigration impact:", file=sys.stderr)
+    lines.append("")
+    lines.append("Migration impact:")
     if change < 0:
-        print(f"  Estimated reduction: {abs(change):,.2f} GB ({abs(change_pct):.1f}% smaller)", file=sys.stderr)
+        lines.append(f"  Estimated reduction: {abs(change):,.2f} GB ({abs(change_pct):.1f}% smaller)")
     else:
-        print(f"  Estimated increase: {change:,.2f} GB ({change_pct:.1f}% larger)", file=sys.stderr)
+        lines.append(f"  Estimated increase: {change:,.2f} GB ({change_pct:.1f}% larger)")
 
     # Note about accuracy
-    print(f"\nNote: Estimates account for RAID overhead removal and data expansion", file=sys.stderr)
-    print(f"      from dedup/compression. Actual results may vary based on workload.", file=sys.stderr)
-    print("=" * 70, file=sys.stderr)
+    lines.append("")
+    lines.append("Note: Estimates account for RAID overhead removal and data expansion")
+    lines.append("      from dedup/compression. Actual results may vary based on workload.")
+    lines.append("=" * 70)
+    sys.stderr.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":